@@ -1,14 +1,73 @@
 import json
 import logging
+import os
+import threading
 from abc import ABCMeta, abstractmethod
-from typing import Any
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from qiskit.qasm3 import loads
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
 
 logger = logging.getLogger("device_gateway")
 
 # Constants
 SUCCESS_MESSAGE = "job is succeeded"
+PARSED_PROGRAM_CACHE_SIZE = 128
+
+
+def load_program(program: str) -> "QuantumCircuit":
+    """Parse an OpenQASM 3 program into a Qiskit circuit without caching it.
+
+    Backends that cache their own compiled form use this instead of
+    parse_program, so the parsed circuit is not kept alive twice.
+    """
+    # Imported on first use to keep qiskit out of the gateway's start-up path
+    from qiskit.qasm3 import loads
+
+    return loads(program)
+
+
+@lru_cache(maxsize=PARSED_PROGRAM_CACHE_SIZE)
+def parse_program(program: str) -> "QuantumCircuit":
+    """Parse an OpenQASM 3 program into a Qiskit circuit.
+
+    Parsed circuits are cached by program text, so repeated submissions of the
+    same program skip the parser. The returned circuit is shared between calls
+    and must not be modified.
+    """
+    return load_program(program)
+
+
+class topology_cached_property:
+    """Like functools.cached_property, but cached per loaded device topology.
+
+    The value is stored next to the topology it was computed for, so reloading
+    the topology drops every derived value at once. A computation that races
+    with a reload stores its result with the replaced topology, where it is
+    never read again.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.attrname = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.attrname = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # read the cache of the current topology once, before computing
+        derived = instance._device_topology_cache[2]
+        try:
+            return derived[self.attrname]
+        except KeyError:
+            value = derived[self.attrname] = self.func(instance)
+            return value
 
 
 class BaseBackend(metaclass=ABCMeta):
@@ -21,8 +80,23 @@ class BaseBackend(metaclass=ABCMeta):
         """
         Initialize the backend with the configuration.
         This is done once at server startup.
+        The device topology is loaded here and reloaded only when its file changes.
         """
         self.config = config
+        self._plugin_name = self.config.get("plugin", {}).get("name", "qulacs")
+        self._device_status_cache: tuple[tuple[int, int], str] | None = None
+        # Serializes replacing the topology; readers take the tuple lock-free
+        self._device_topology_lock = threading.RLock()
+        # (file stamp, topology, values derived from the topology)
+        self._device_topology_cache: tuple[
+            tuple[int, int] | None, dict, dict[str, Any]
+        ] = (self._device_topology_stamp(), self.load_device_topology(), {})
+        self._device_info = MappingProxyType(
+            {
+                **self.config.get("device_info", {}),
+                "type": "simulator" if self.is_simulator() else "QPU",
+            }
+        )
 
     def load_device_topology(self):
         """
@@ -41,8 +115,59 @@ class BaseBackend(metaclass=ABCMeta):
         return device_status
 
     def save_device_topology(self, device_topology):
-        with open(self.config["device_topology_json_path"], "w") as f:
-            json.dump(device_topology, f, indent=4)
+        """
+        Save the device topology to the JSON file and refresh the in-memory copy.
+        """
+        with self._device_topology_lock:
+            with open(self.config["device_topology_json_path"], "w") as f:
+                json.dump(device_topology, f, indent=4)
+            self._device_topology_cache = (
+                self._device_topology_stamp(),
+                device_topology,
+                {},
+            )
+            self._clear_physical_map_cache()
+
+    def _device_topology_stamp(self) -> tuple[int, int] | None:
+        """
+        Returns the modification time and size of the device topology file.
+        None is returned when the file is not configured or cannot be read.
+        """
+        path = self.config.get("device_topology_json_path")
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def refresh_device_topology(self) -> dict:
+        """
+        Reload the device topology if its file has changed since it was loaded.
+        The mappings derived from the topology are rebuilt on the next access.
+        """
+        stamp = self._device_topology_stamp()
+        if stamp is not None and stamp != self._device_topology_cache[0]:
+            with self._device_topology_lock:
+                # another thread may have reloaded it while this one waited
+                if stamp != self._device_topology_cache[0]:
+                    self._device_topology_cache = (
+                        stamp,
+                        self.load_device_topology(),
+                        {},
+                    )
+                    self._clear_physical_map_cache()
+        return self._device_topology_cache[1]
+
+    def _clear_physical_map_cache(self):
+        """
+        Drop the cached mappings derived from the device topology.
+        Subclasses extend this to drop their own topology-dependent state.
+        """
+        with self._device_topology_lock:
+            stamp, device_topology, _ = self._device_topology_cache
+            self._device_topology_cache = (stamp, device_topology, {})
 
     def is_active(self) -> bool:
         """
@@ -66,25 +191,22 @@ class BaseBackend(metaclass=ABCMeta):
         """
         Check if the device is a simulator.
         """
-        plugin_config = self.config.get("plugin", {})
-        plugin_name = plugin_config.get("name", "qulacs")
-        return plugin_name == "qulacs"
+        return self._plugin_name == "qulacs"
 
     def is_qpu(self) -> bool:
         """
         Check if the device is a QPU.
         """
-        plugin_config = self.config.get("plugin", {})
-        plugin_name = plugin_config.get("name", "qulacs")
-        return plugin_name == "qubex"
+        return self._plugin_name == "qubex"
 
     @property
     def device_topology(self) -> dict:
         """
         Returns the device topology, e.g., {"qubits": [{"id": 0, "physical_id": 5}], "couplings": [{"control": 0, "target": 1}]}
+        The file is re-read only when its modification time or size changes.
         """
-        return self.load_device_topology()
-    
+        return self.refresh_device_topology()
+
     @property
     def physical_ids(self) -> list:
         """
@@ -93,30 +215,32 @@ class BaseBackend(metaclass=ABCMeta):
         return [qubit["physical_id"] for qubit in self.device_topology["qubits"]]
 
     @property
-    def device_status(self) -> dict:
+    def device_status(self) -> str:
         """
         Returns the device status, e.g., "active", "inactive", "maintenance"
+        The file is re-read only when its modification time or size changes.
         """
-        return self.load_device_status()
+        stat = os.stat(self.config["device_status_path"])
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._device_status_cache is None or self._device_status_cache[0] != key:
+            self._device_status_cache = (key, self.load_device_status())
+        return self._device_status_cache[1]
 
     @property
-    def device_info(self) -> dict:
+    def device_info(self) -> Mapping[str, Any]:
         """
-        Returns the device information, e.g., {"device_id": "QPU1", "device_type": "QPU"}
+        Returns the device information, e.g., {"device_id": "QPU1", "type": "QPU"}
+        The type field is resolved once at initialization and the mapping is read-only.
         """
-        if self.is_simulator():
-            self.config["device_info"]["type"] = "simulator"
-        else:
-            self.config["device_info"]["type"] = "QPU"
-        return self.config["device_info"]
+        return self._device_info
 
-    @property
+    @topology_cached_property
     def physical_map(self):
         """
         Returns the physical index to physical label mapping.
         The mapping is in the format physical_map: {'qubits': {0: 'Q29', 1: 'Q30', 2: 'Q31'}, 'couplings': {(2, 0): ('Q31', 'Q29'), (2, 1): ('Q31', 'Q30')}}"}
         """
-        device_topology = self.load_device_topology()
+        device_topology = self.device_topology
         qubits = {
             qubit["id"]: f"Q{qubit['physical_id']:02}"
             for qubit in device_topology["qubits"]
@@ -130,43 +254,53 @@ class BaseBackend(metaclass=ABCMeta):
         }
         return {"qubits": qubits, "couplings": couplings}
 
-    @property
-    def qubits(self) -> list:
+    @topology_cached_property
+    def qubits(self) -> tuple[str, ...]:
         """
-        Returns a list of qubit labels, e.g., ["Q05", "Q07"]
+        Returns a tuple of qubit labels, e.g., ("Q05", "Q07")
         """
-        return list(self.physical_map["qubits"].values())  # type: ignore
+        return tuple(self.physical_map["qubits"].values())  # type: ignore
 
-    @property
-    def couplings(self) -> list:
+    @topology_cached_property
+    def qubits_set(self) -> frozenset[str]:
         """
-        Returns a list of couplings in the format "QXX-QYY", e.g., ["Q05-Q07", "Q07-Q05"]
+        Returns the qubit labels as a frozenset for membership checks, e.g., frozenset({"Q05", "Q07"})
         """
-        return [
-            f"{v[0]}-{v[1]}"
-            for v in self.physical_map["couplings"].values()  # type: ignore
-        ]  # type: ignore
+        return frozenset(self.physical_map["qubits"].values())  # type: ignore
 
-    @property
-    def physical_index_to_physical_label(self) -> dict:
+    @topology_cached_property
+    def couplings(self) -> tuple[str, ...]:
+        """
+        Returns a tuple of couplings in the format "QXX-QYY", e.g., ("Q05-Q07", "Q07-Q05")
+        """
+        return tuple(
+            f"{control}-{target}"
+            for control, target in self.physical_map["couplings"].values()  # type: ignore
+        )
+
+    @topology_cached_property
+    def physical_index_to_physical_label(self) -> Mapping[int, str]:
         """
         Returns the physical index to physical label mapping, e.g., {0: "Q05", 1: "Q07"}
         """
-        # Return a shallow copy to avoid accidental modifications
-        return self.physical_map["qubits"].copy()  # type: ignore
+        # Return a read-only view to avoid accidental modifications without copying
+        return MappingProxyType(self.physical_map["qubits"])  # type: ignore
 
-    @property
-    def physical_label_to_physical_index(self) -> dict:
+    @topology_cached_property
+    def physical_label_to_physical_index(self) -> Mapping[str, int]:
         """
         Returns the physical label to physical index mapping, e.g., {"Q05": 0, "Q07": 1}
         """
-        return {v: k for k, v in self.physical_index_to_physical_label.items()}
+        # Built once per topology and shared as a read-only view
+        return MappingProxyType(
+            {v: k for k, v in self.physical_map["qubits"].items()}  # type: ignore
+        )
 
     def physical_label(self, physical_index: str) -> str:
         """
         Returns the physical label corresponding to the physical index.
         """
-        return self.physical_index_to_physical_label[physical_index]
+        return self.physical_map["qubits"][physical_index]  # type: ignore
 
     def physical_index(self, physical_label: str) -> int:
         """
@@ -208,8 +342,11 @@ class BaseBackend(metaclass=ABCMeta):
             d: Dictionary with string keys and integer values.
         Returns:
             Dictionary with zero values removed.
+            The input dictionary itself is returned when it has no zero values.
 
         """
+        if all(d.values()):
+            return d
         return {k: v for k, v in d.items() if v != 0}
 
     def execute(self, program: str, shots: int = 1024) -> tuple[dict, str]:
@@ -225,11 +362,12 @@ class BaseBackend(metaclass=ABCMeta):
             The counts are in the format {"000": 512, "111": 512}.
 
         """
-        qc = loads(program)
+        self.refresh_device_topology()
+        qc = parse_program(program)
         circuit = self._get_circuit()
         compiled_circuit = circuit.compile(qc)
         counts = self._execute(compiled_circuit, shots=shots)
         counts = self._remove_zero_values(counts)
-        logger.info(f"counts={counts}")
+        logger.info("counts=%s", counts)
 
         return counts, SUCCESS_MESSAGE
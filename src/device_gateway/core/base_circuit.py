@@ -1,6 +1,8 @@
 from abc import ABCMeta
+from typing import TYPE_CHECKING
 
-from qiskit import QuantumCircuit as QiskitQuantumCircuit
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit as QiskitQuantumCircuit
 
 
 class BaseCircuit(metaclass=ABCMeta):
@@ -10,6 +12,8 @@ class BaseCircuit(metaclass=ABCMeta):
     which is then passed to the backend for execution.
     """
 
+    __slots__ = ("program",)
+
     def __init__(self):
         # Store instructions as a list of tuples, e.g., ("cnot", control, target)
         self.program = None
@@ -42,7 +46,7 @@ class BaseCircuit(metaclass=ABCMeta):
         """
         raise NotImplementedError("This method is not implemented")
 
-    def compile(self, qc: QiskitQuantumCircuit):
+    def compile(self, qc: "QiskitQuantumCircuit"):
         """
         Compile the circuit by performing validation or optimization if necessary.
         Returns the compiled circuit, which in this simple example is just the list of instructions.
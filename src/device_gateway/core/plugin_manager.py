@@ -2,18 +2,35 @@
 
 import importlib
 import logging
+import sys
+from functools import cache
 from typing import Any, Dict, Optional, Type
 
 from device_gateway.core.base_backend import BaseBackend
 
 logger = logging.getLogger("device_gateway")
 
-SUPPORTED_BACKENDS = ("qulacs", "qubex")  # Tuple of supported backend names
+SUPPORTED_BACKENDS = frozenset({"qulacs", "qubex"})  # Set of supported backend names
+
+
+@cache
+def _import_class(module_path: str, class_name: str) -> type:
+    """Import a class from a module, caching the result per dotted path.
+
+    Raises:
+        ImportError: If module cannot be imported
+        AttributeError: If class is not found in module
+    """
+    # Skip the import machinery when the module is already loaded
+    module = sys.modules.get(module_path) or importlib.import_module(module_path)
+    return getattr(module, class_name)
 
 
 class BackendPluginManager:
     """Backend plugin manager."""
 
+    __slots__ = ("_backends",)
+
     def __init__(self):
         """Initialize plugin manager."""
         self._backends = {}
@@ -25,6 +42,9 @@ class BackendPluginManager:
             name: Backend name
             backend_class: Backend class
         """
+        # Re-registering the same class needs neither validation nor logging
+        if self._backends.get(name) is backend_class:
+            return
         if not issubclass(backend_class, BaseBackend):
             raise ValueError(
                 f"Backend class must inherit from BaseBackend: {backend_class}"
@@ -45,9 +65,11 @@ class BackendPluginManager:
         Raises:
             ValueError: If backend is not found
         """
-        if name not in self._backends:
-            raise ValueError(f"Backend not found: {name}")
-        return self._backends[name](config)
+        try:
+            backend_class = self._backends[name]
+        except KeyError:
+            raise ValueError(f"Backend not found: {name}") from None
+        return backend_class(config)
 
     def load_backend(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Load a backend plugin from a module path.
@@ -60,23 +82,32 @@ class BackendPluginManager:
             AttributeError: If class is not found in module
             ValueError: If backend configuration is invalid
         """
+        if config is None:
+            config = {}
+
+        plugin_config = config.get("plugin", {})
+        if not plugin_config:
+            raise ValueError("Plugin configuration is missing")
+
+        name = plugin_config.get("name", "qulacs")
+        backend_settings = plugin_config.get("backend", {})
+        default_module_path = f"device_gateway.plugins.{name}.backend"
+        default_class_name = f"{name.capitalize()}Backend"
+
+        module_path = backend_settings.get("module_path", default_module_path)
+        class_name = backend_settings.get("class_name", default_class_name)
+
+        # Loading the same backend again (e.g., on config reload) is a no-op
+        registered_class = self._backends.get(name)
+        if (
+            registered_class is not None
+            and registered_class.__module__ == module_path
+            and registered_class.__name__ == class_name
+        ):
+            return
+
         try:
-            if config is None:
-                config = {}
-
-            plugin_config = config.get("plugin", {})
-            if not plugin_config:
-                raise ValueError("Plugin configuration is missing")
-
-            name = plugin_config.get("name", "qulacs")
-            backend_settings = plugin_config.get("backend", {})
-            default_module_path = f"device_gateway.plugins.{name}.backend"
-            default_class_name = f"{name.capitalize()}Backend"
-
-            module_path = backend_settings.get("module_path", default_module_path)
-            class_name = backend_settings.get("class_name", default_class_name)
-            module = importlib.import_module(module_path)
-            backend_class = getattr(module, class_name)
+            backend_class = _import_class(module_path, class_name)
             self.register_backend(name, backend_class)
         except ImportError as e:
             logger.error(f"Failed to import backend module {module_path}: {e}")
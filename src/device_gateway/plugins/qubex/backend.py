@@ -2,14 +2,17 @@ import logging
 import os
 
 import numpy as np
-from qiskit.qasm3 import loads
-from qiskit.result import Counts, LocalReadoutMitigator, ProbDistribution
 from qubex.experiment import Experiment
 from qubex.measurement.measurement import DEFAULT_INTERVAL, DEFAULT_SHOTS
 from qubex.pulse import PulseSchedule
 from qubex.version import get_package_version
 
-from device_gateway.core.base_backend import SUCCESS_MESSAGE, BaseBackend
+from device_gateway.core.base_backend import (
+    SUCCESS_MESSAGE,
+    BaseBackend,
+    parse_program,
+    topology_cached_property,
+)
 from device_gateway.plugins.qubex.circuit import QubexCircuit
 
 logger = logging.getLogger("device_gateway")
@@ -20,6 +23,7 @@ class QubexBackend(BaseBackend):
         super().__init__(config)
         logger.info(f"Qubex version: {get_package_version('qubex')}")
         self._execute_readout_calibration = True
+        self._cm_inv_cache: dict[tuple[str, ...], np.ndarray | None] = {}
         self._experiment = Experiment(
             chip_id=os.getenv("CHIP_ID", "64Q"),
             qubits=self.physical_ids,
@@ -31,15 +35,15 @@ class QubexBackend(BaseBackend):
         )
         logger.info(f"Qubex version: {get_package_version('qubex')}")
 
-    @property
+    @topology_cached_property
     def physical_map(self):
         """
         Returns the physical index to physical label mapping.
         The mapping is in the format physical_map: {'qubits': {0: 'Q29', 1: 'Q30', 2: 'Q31'}, 'couplings': {(2, 0): ('Q31', 'Q29'), (2, 1): ('Q31', 'Q30')}}"}
         """
-        device_topology = self.load_device_topology()
+        device_topology = self.device_topology
         qubits = {
-            qubit["id"]: f"{self._experiment.get_qubit_label(int(qubit["physical_id"]))}"
+            qubit["id"]: self._experiment.get_qubit_label(int(qubit["physical_id"]))
             for qubit in device_topology["qubits"]
         }
         couplings = {
@@ -51,24 +55,29 @@ class QubexBackend(BaseBackend):
         }
         return {"qubits": qubits, "couplings": couplings}
 
+    @topology_cached_property
+    def _qubits_by_id(self) -> dict:
+        """
+        Returns the device topology qubits keyed by their id.
+        """
+        return {qubit["id"]: qubit for qubit in self.device_topology.get("qubits", [])}
+
     def _search_qubit_by_id(self, id):
-        for qubit in self.device_topology.get("qubits", []):
-            if qubit.get("id") == id:
-                return qubit
-        return None
+        return self._qubits_by_id.get(id)
 
     def _build_classifier(self):
         """
-        Build the classifier for a given qubit.
+        Build the classifiers for all qubits in a single measurement run.
         This method is called during the initialization of the QubexBackend.
         """
+        logger.info(f"Building classifier for qubits {self.qubits}")
+        res = self._experiment.build_classifier(targets=self.qubits, plot=False)
+        readout_fidelities = res["readout_fidelties"]
         note = {}
         for qubit in self.qubits:
-            logger.info(f"Building classifier for qubit {qubit}")
-            res = self._experiment.build_classifier(targets=qubit, plot=False)
             note[qubit] = {
-                "p0m1": 1 - res["readout_fidelties"][qubit][0],
-                "p1m0": 1 - res["readout_fidelties"][qubit][1],
+                "p0m1": 1 - readout_fidelities[qubit][0],
+                "p1m0": 1 - readout_fidelities[qubit][1],
             }
         return note
 
@@ -78,6 +87,7 @@ class QubexBackend(BaseBackend):
         This method is called during the initialization of the QubexBackend.
         """
         readout_errors = self._build_classifier()
+        self._cm_inv_cache.clear()
         self._update_device_topology_readout_errors(readout_errors)
 
     def _update_device_topology_readout_errors(self, readout_errors):
@@ -86,8 +96,7 @@ class QubexBackend(BaseBackend):
         This method is called during the initialization of the QubexBackend.
         """
         device_topology = self.device_topology
-        for qubit in self.qubits:
-            id = self.physical_index(qubit)
+        for id, qubit in self.physical_index_to_physical_label.items():
             qubit_info = self._search_qubit_by_id(id)
             if qubit_info is not None:
                 qubit_info["meas_error"]["prob_meas1_prep0"] = readout_errors[qubit][
@@ -123,18 +132,19 @@ class QubexBackend(BaseBackend):
         """Execute the compiled circuit for a specified number of shots.
         The compiled_circuit is produced by the PulseSchedule class.
         """
+        self.refresh_device_topology()
         if self.is_active() and self._execute_readout_calibration:
             self._experiment.connect()
             logger.info("Qubex experiment connect successfully")
             logger.info("Performing readout calibration")
             self._readout_calibration()
             self._execute_readout_calibration = False
-        qc = loads(program)
+        qc = parse_program(program)
         circuit = self._get_circuit()
         compiled_circuit = circuit.compile(qc)
         counts = self._execute(compiled_circuit, shots=shots)
         counts = self._remove_zero_values(counts)
-        logger.info(f"counts={counts}")
+        logger.info("counts=%s", counts)
         return counts, SUCCESS_MESSAGE
 
     def qubex_error_mitigation(
@@ -146,20 +156,33 @@ class QubexBackend(BaseBackend):
         """
         Mitigate the measurement result.
         """
-        physical_qubits = []
-        for qubit in measured_qubits:
-            physical_qubits.append(self.physical_label(qubit))
-        total = sum(counts.values())
-        probabilities = {key: count / total for key, count in counts.items()}
-        labels = [f"{i}" for i in probabilities.keys()]
-        prob = np.array(list(probabilities.values()))
-        cm_inv = self._experiment.get_inverse_confusion_matrix(
-            targets=self.classical_registers
-        )
-        mitigated_prob = prob @ cm_inv
-        prob_dict = dict(zip(labels, mitigated_prob))
-        mitigated_counts = {k: int(v * shots) for k, v in prob_dict.items()}
-        return mitigated_counts
+        labels = list(counts)
+        prob = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        prob /= prob.sum()
+        cm_inv = self._get_inverse_confusion_matrix(tuple(self.classical_registers))
+        if cm_inv is not None:
+            prob = prob @ cm_inv
+        mitigated_counts = (prob * shots).astype(np.int64)
+        return dict(zip(labels, mitigated_counts.tolist()))
+
+    def _get_inverse_confusion_matrix(
+        self, targets: tuple[str, ...]
+    ) -> np.ndarray | None:
+        """
+        Return the inverse confusion matrix for the targets.
+        None is returned when the matrix is the identity.
+        The matrix is cached until the next readout calibration.
+        """
+        try:
+            return self._cm_inv_cache[targets]
+        except KeyError:
+            pass
+        cm_inv = self._experiment.get_inverse_confusion_matrix(targets=list(targets))
+        if np.allclose(cm_inv, np.eye(cm_inv.shape[0])):
+            # No readout error to correct, so the matrix product can be skipped
+            cm_inv = None
+        self._cm_inv_cache[targets] = cm_inv
+        return cm_inv
 
     def qiskit_error_mitigation(
         self,
@@ -167,7 +190,9 @@ class QubexBackend(BaseBackend):
         shots,
         measured_qubits,
     ) -> dict[str, int]:
-        assignment_matrices = []
+        # Only needed for this mitigation method, so imported on first use
+        from qiskit.result import Counts, LocalReadoutMitigator, ProbDistribution
+
         qubits = self.device_topology["qubits"]
         n_qubits = len(measured_qubits)
 
@@ -178,16 +203,24 @@ class QubexBackend(BaseBackend):
                 "input measured_qubits is too large, it requires a memory of over 32GB"
             )
 
-        for id in measured_qubits:
-            mes_error = qubits[id]["meas_error"]
-            amat = np.array(
-                [
-                    [1 - mes_error["prob_meas1_prep0"], mes_error["prob_meas0_prep1"]],
-                    [mes_error["prob_meas1_prep0"], 1 - mes_error["prob_meas0_prep1"]],
-                ],
-                dtype=float,
-            )
-            assignment_matrices.append(amat)
+        # Build all 2x2 assignment matrices as one (n_qubits, 2, 2) array
+        meas_errors = [qubits[id]["meas_error"] for id in measured_qubits]
+        prob_meas1_prep0 = np.fromiter(
+            (mes_error["prob_meas1_prep0"] for mes_error in meas_errors),
+            dtype=np.float64,
+            count=n_qubits,
+        )
+        prob_meas0_prep1 = np.fromiter(
+            (mes_error["prob_meas0_prep1"] for mes_error in meas_errors),
+            dtype=np.float64,
+            count=n_qubits,
+        )
+        amats = np.empty((n_qubits, 2, 2), dtype=np.float64)
+        amats[:, 0, 0] = 1 - prob_meas1_prep0
+        amats[:, 0, 1] = prob_meas0_prep1
+        amats[:, 1, 0] = prob_meas1_prep0
+        amats[:, 1, 1] = 1 - prob_meas0_prep1
+        assignment_matrices = list(amats)
         local_mitigator = LocalReadoutMitigator(assignment_matrices)
         bin_counts = {f"0b{k}": v for k, v in counts.items()}
 
@@ -1,76 +1,170 @@
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-from qiskit import QuantumCircuit as QiskitQuantumCircuit
 from qubex.pulse import Blank, PulseSchedule, VirtualZ
 
 from device_gateway.core.base_circuit import BaseCircuit
 from device_gateway.core.gate_set import SUPPORTED_GATES
 
 if TYPE_CHECKING:
+    from qiskit import QuantumCircuit as QiskitQuantumCircuit
+
     from device_gateway.plugins.qubex.backend import QubexBackend
 
 logger = logging.getLogger("device_gateway")
 
 
+class _PulseScheduler:
+    """Ordered list of pulse schedules that batches single-qubit pulses.
+
+    X/SX pulses on a qubit are collected into one run until a barrier or
+    another schedule touching the qubit is appended, so compile() creates and
+    calls one PulseSchedule per run instead of one per gate.
+    """
+
+    __slots__ = ("_items", "_runs")
+
+    def __init__(self):
+        self._items: list = []
+        self._runs: dict[str, list] = {}
+
+    def add_pulse(self, target: str, pulse):
+        run = self._runs.get(target)
+        if run is None:
+            run = self._runs[target] = []
+            self._items.append((target, run))
+        run.append(pulse)
+
+    def append(self, item, targets: tuple[str, ...] = ()):
+        if item == "barrier":
+            self._runs.clear()
+        else:
+            for target in targets:
+                self._runs.pop(target, None)
+        self._items.append(item)
+
+    def __iter__(self):
+        for item in self._items:
+            if isinstance(item, tuple):
+                target, pulses = item
+                with PulseSchedule([target]) as ps:
+                    for pulse in pulses:
+                        ps.add(target, pulse)
+                yield ps
+            else:
+                yield item
+
+
 class QubexCircuit(BaseCircuit):
     """Qubex circuit implementation."""
 
+    __slots__ = (
+        "_backend",
+        "_couplings",
+        "_cx_cache",
+        "_dispatch",
+        "_experiment",
+        "_pulse_cache",
+        "_qubits",
+        "_virtual_z_cache",
+    )
+
     def __init__(self, backend: "QubexBackend"):
         """Initialize the circuit with backend.
         Args:
             backend: Backend to execute the circuit on
         """
         self._backend = backend
+        self._experiment = backend._experiment
+        self._qubits = backend.qubits_set
+        self._couplings = frozenset(backend.couplings)
+        self._cx_cache: dict[tuple[str, str], PulseSchedule] = {}
+        self._pulse_cache: dict[tuple[str, str], Any] = {}
+        self._virtual_z_cache: dict[tuple[str, float], PulseSchedule] = {}
+        # gate name -> handler that appends the gate's pulses in compile();
+        # None marks a supported gate that emits no pulses (measure)
+        self._dispatch: dict[str, Callable[..., None] | None] = dict.fromkeys(
+            SUPPORTED_GATES
+        )
+        self._dispatch.update(
+            {
+                "x": self._compile_x,
+                "sx": self._compile_sx,
+                "rz": self._compile_rz,
+                "cx": self._compile_cx,
+                "delay": self._compile_delay,
+                "barrier": self._compile_barrier,
+            }
+        )
 
     def cx(self, control: str, target: str):
         """Apply CX gate."""
-        if target not in self._backend.qubits or control not in self._backend.qubits:
+        if target not in self._qubits or control not in self._qubits:
             logger.error(f"Invalid qubits for CNOT: {control}, {target}")
             raise ValueError(f"Invalid qubits for CNOT: {control}, {target}")
-        logger.debug(
-            f"Applying CX gate: {self._backend.physical_index(control)} -> {self._backend.physical_index(target)}, Physical qubits: {control} -> {target}"
-        )
-        with PulseSchedule([control, target]) as ps:
-            ps.call(self._backend._experiment.cx(control, target))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Applying CX gate: %s -> %s, Physical qubits: %s -> %s",
+                self._backend.physical_index(control),
+                self._backend.physical_index(target),
+                control,
+                target,
+            )
+        return self._cx_schedule(control, target)
+
+    def _cx_schedule(self, control: str, target: str) -> PulseSchedule:
+        """Return the CX pulse schedule, built once per (control, target)."""
+        ps = self._cx_cache.get((control, target))
+        if ps is None:
+            with PulseSchedule([control, target]) as ps:
+                ps.call(self._experiment.cx(control, target))
+            self._cx_cache[(control, target)] = ps
         return ps
 
     def sx(self, target: str):
         """Apply SX gate."""
-        if target not in self._backend.qubits:
+        if target not in self._qubits:
             logger.error(f"Invalid qubit: {target}")
             raise ValueError(f"Invalid qubit: {target}")
-        logger.debug(
-            f"Applying SX gate: {self._backend.physical_index(target)}, Physical qubit: {target}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Applying SX gate: %s, Physical qubit: %s",
+                self._backend.physical_index(target),
+                target,
+            )
         with PulseSchedule([target]) as ps:
-            ps.add(target, self._backend._experiment.x90(target))
+            ps.add(target, self._gate_pulse("x90", target))
         return ps
 
     def x(self, target: str):
         """Apply X gate."""
-        if target not in self._backend.qubits:
+        if target not in self._qubits:
             logger.error(f"Invalid qubit: {target}")
             raise ValueError(f"Invalid qubit: {target}")
-        logger.debug(
-            f"Applying X gate: {self._backend.physical_index(target)}, Physical qubit: {target}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Applying X gate: %s, Physical qubit: %s",
+                self._backend.physical_index(target),
+                target,
+            )
         with PulseSchedule([target]) as ps:
-            ps.add(target, self._backend._experiment.x180(target))
+            ps.add(target, self._gate_pulse("x180", target))
         return ps
 
     def rz(self, target: str, angle: float):
         """Apply RZ gate."""
-        if target not in self._backend.qubits:
+        if target not in self._qubits:
             logger.error(f"Invalid qubit: {target}")
             raise ValueError(f"Invalid qubit: {target}")
-        logger.debug(
-            f"Applying RZ gate: {self._backend.physical_index(target)}, Physical qubit: {target}, angle={angle}"
-        )
-        with PulseSchedule([target]) as ps:
-            ps.add(target, VirtualZ(angle))
-
-        return ps
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Applying RZ gate: %s, Physical qubit: %s, angle=%s",
+                self._backend.physical_index(target),
+                target,
+                angle,
+            )
+        return self._virtual_z_schedule(target, angle)
 
     def barrier(self):
         """Apply barrier."""
@@ -104,81 +198,124 @@ class QubexCircuit(BaseCircuit):
 
     def delay(self, target: str, duration: float):
         """Apply delay."""
-        if target not in self._backend.qubits:
+        if target not in self._qubits:
             logger.error(f"Invalid qubit: {target}")
             raise ValueError(f"Invalid qubit: {target}")
         if duration <= 0:
             logger.error(f"Invalid duration: {duration}")
             raise ValueError(f"Invalid duration: {duration}")
-        logger.debug(f"Applying delay for {duration} seconds")
+        logger.debug("Applying delay for %s seconds", duration)
         with PulseSchedule() as ps:
             ps.add(target, Blank(duration))
         return ps
 
     def rz_correction(self, target: str, angle: float):
         """Apply RZ correction."""
-        if target not in self._backend.couplings:
+        if target not in self._couplings:
             logger.error(f"Invalid coupling: {target}")
             raise ValueError(f"Invalid coupling: {target}")
-        with PulseSchedule([target]) as ps:
-            ps.add(target, VirtualZ(angle))
+        return self._virtual_z_schedule(target, angle)
 
-        return ps
+    def _sorted_physical_qubits_and_couplings(
+        self,
+        used_physical_qubit_mask: int,
+        used_physical_couplings: set[tuple[str, str]],
+    ):
+        """Return the used physical qubits and couplings as sorted lists.
 
-    def _used_physical_qubits_and_couplings(self, qc: QiskitQuantumCircuit):
-        """Return the used physical qubits and couplings."""
-        used_physical_qubits = set()
-        used_physical_couplings = set()
+        The qubits are given as a bitmask whose bit i marks physical index i.
+        The couplings are given as (control, target) label pairs and are
+        returned in the "QXX-QYY" format, formatting each unique edge once.
+        """
+        # Walking the set bits from the lowest yields the physical qubits in
+        # index order without a keyed sort
+        sorted_physical_qubits = []
+        while used_physical_qubit_mask:
+            lowest_bit = used_physical_qubit_mask & -used_physical_qubit_mask
+            sorted_physical_qubits.append(
+                self._backend.physical_label(lowest_bit.bit_length() - 1)
+            )
+            used_physical_qubit_mask ^= lowest_bit
+        sorted_physical_couplings = sorted(
+            f"{control}-{target}" for control, target in used_physical_couplings
+        )
 
-        for instruction in qc.data:
-            name = instruction.name
-            if name not in SUPPORTED_GATES:
-                logger.error(f"Unsupported instruction: {name}")
-                raise ValueError(f"Unsupported instruction: {name}")
+        return sorted_physical_qubits, sorted_physical_couplings
 
-            virtual_index = qc.find_bit(instruction.qubits[0]).index
-            physical_label = self._backend.physical_label(virtual_index)
-            used_physical_qubits.add(physical_label)
+    def _virtual_z_schedule(self, target: str, angle: float) -> PulseSchedule:
+        """Return the virtual Z schedule, built once per (target, angle)."""
+        ps = self._virtual_z_cache.get((target, angle))
+        if ps is None:
+            with PulseSchedule([target]) as ps:
+                ps.add(target, VirtualZ(angle))
+            self._virtual_z_cache[(target, angle)] = ps
+        return ps
 
-            if name == "cx":
-                virtual_target_index = qc.find_bit(instruction.qubits[1]).index
-                physical_target_label = self._backend.physical_label(
-                    virtual_target_index
-                )
-                used_physical_qubits.add(physical_target_label)
-                coupling = f"{physical_label}-{physical_target_label}"
-                used_physical_couplings.add(coupling)
-
-        # Convert sets to sorted lists
-        # Sort physical qubits based on their virtual qubit indices
-        physical_to_virtual = self._backend.physical_label_to_physical_index
-        sorted_physical_qubits = sorted(
-            list(used_physical_qubits), key=lambda x: physical_to_virtual[x]
+    def _gate_pulse(self, gate: str, target: str):
+        """Return the experiment's pulse for the gate on the target, built once.
+
+        Args:
+            gate: Name of the Experiment pulse method, e.g., "x90" or "x180"
+            target: Physical qubit label
+        """
+        pulse = self._pulse_cache.get((gate, target))
+        if pulse is None:
+            pulse = getattr(self._experiment, gate)(target)
+            self._pulse_cache[(gate, target)] = pulse
+        return pulse
+
+    # compile() passes every operand by keyword and each _compile_* handler
+    # names only the ones it reads. Handlers append to the _PulseScheduler
+    # rather than returning a schedule, so consecutive X/SX pulses can merge.
+    def _compile_x(self, pulse_scheduler, *, physical_label, **_):
+        pulse_scheduler.add_pulse(
+            physical_label, self._gate_pulse("x180", physical_label)
         )
-        sorted_physical_couplings = sorted(list(used_physical_couplings))
 
-        return sorted_physical_qubits, sorted_physical_couplings
+    def _compile_sx(self, pulse_scheduler, *, physical_label, **_):
+        pulse_scheduler.add_pulse(
+            physical_label, self._gate_pulse("x90", physical_label)
+        )
 
-    def _cr_channel_has_this_target(
-        self, target: str, used_physical_couplings: list[str]
+    def _compile_rz(
+        self,
+        pulse_scheduler,
+        *,
+        instruction,
+        physical_label,
+        cr_channels_by_target,
+        **_,
     ):
-        for coupling in used_physical_couplings:
-            con, tar = coupling.split("-")
-            if tar == target:
-                return True
-        return False
-
-    def _cr_channels_of_this_target(
-        self, target: str, used_physical_couplings: list[str]
-    ) -> list[str]:
-        channels: list[str] = []
-        for coupling in used_physical_couplings:
-            _, tar = coupling.split("-")
-            if tar == target:
-                channels.append(coupling)
-        return channels
+        angle = instruction.params[0]
+        ## lock with barrier for Virtual Z gate
+        pulse_scheduler.append(self.barrier())
+        pulse_scheduler.append(
+            self._virtual_z_schedule(physical_label, angle), (physical_label,)
+        )
+        # following pulse is for the correction of Virtual Z gate
+        # we need to apply Virtual Z gate to cr channels, shared with same target
+        cr_channels = cr_channels_by_target.get(physical_label)
+        if cr_channels:
+            for cr_channel in cr_channels:
+                pulse_scheduler.append(self.rz_correction(cr_channel, angle))
+            pulse_scheduler.append(self.barrier())
+
+    def _compile_cx(
+        self, pulse_scheduler, *, physical_label, physical_target_label, **_
+    ):
+        pulse_scheduler.append(
+            self._cx_schedule(physical_label, physical_target_label),
+            (physical_label, physical_target_label),
+        )
+
+    def _compile_delay(self, pulse_scheduler, *, instruction, physical_label, **_):
+        duration = self.get_delay_in_ns(instruction.operation)
+        pulse_scheduler.append(self.delay(physical_label, duration), (physical_label,))
 
-    def compile(self, qc: QiskitQuantumCircuit) -> PulseSchedule:
+    def _compile_barrier(self, pulse_scheduler, **_):
+        pulse_scheduler.append(self.barrier())
+
+    def compile(self, qc: "QiskitQuantumCircuit") -> PulseSchedule:
         """Compile a Qiskit circuit to a  Qubex pulse scheduler.
 
         Args:
@@ -190,78 +327,86 @@ class QubexCircuit(BaseCircuit):
         Raises:
             ValueError: If an unsupported instruction is encountered
         """
-        used_physical_qubits, used_physical_couplings = (
-            self._used_physical_qubits_and_couplings(qc)
+        # Validate the instructions, collect the used qubits and couplings and
+        # the measurement mapping in a single pass; the pulses are emitted
+        # afterwards because the RZ correction needs every CR channel up front.
+        qubit_index = {qubit: index for index, qubit in enumerate(qc.qubits)}
+        clbit_index = {clbit: index for index, clbit in enumerate(qc.clbits)}
+        physical_index_to_physical_label = (
+            self._backend.physical_index_to_physical_label
         )
-        logger.debug(f"physical_map: {self._backend.physical_map}")
+        used_physical_qubit_mask = 0
+        used_physical_couplings = set()
         classical_bit_mapping = {}
-
-        pulse_scheduler = []
+        operations = []
         for instruction in qc.data:
             name = instruction.operation.name
-            if name not in SUPPORTED_GATES:
+            try:
+                handler = self._dispatch[name]
+            except KeyError:
                 logger.error(f"Unsupported instruction: {name}")
-                raise ValueError(f"Unsupported instruction: {name}")
-
-            physical_index = qc.find_bit(instruction.qubits[0]).index
-            physical_label = self._backend.physical_label(physical_index)
-            # used_physical_qubits.add(physical_label)
-
-            if name == "x":
-                pulse_scheduler.append(self.x(physical_label))
-            elif name == "sx":
-                pulse_scheduler.append(self.sx(physical_label))
-            elif name == "rz":
-                angle = instruction.params[0]
-                ## lock with barrier for Virtual Z gate
-                pulse_scheduler.append(self.barrier())
-                pulse_scheduler.append(self.rz(physical_label, angle))
-                # following pulse is for the correction of Virtual Z gate
-                # we need to apply Virtual Z gate to cr channels, shared with same target
-                if self._cr_channel_has_this_target(
-                    target=physical_label,
-                    used_physical_couplings=used_physical_couplings,
-                ):
-                    for cr_channel in self._cr_channels_of_this_target(
-                        target=physical_label,
-                        used_physical_couplings=used_physical_couplings,
-                    ):
-                        pulse_scheduler.append(self.rz_correction(cr_channel, angle))
-                    pulse_scheduler.append(self.barrier())
-
-            elif name == "cx":
-                physical_target_index = qc.find_bit(instruction.qubits[1]).index
-                physical_target_label = self._backend.physical_label(
-                    physical_target_index
-                )
-                pulse_scheduler.append(self.cx(physical_label, physical_target_label))
-            elif name == "measure":
+                raise ValueError(f"Unsupported instruction: {name}") from None
+
+            physical_index = qubit_index[instruction.qubits[0]]
+            physical_label = physical_index_to_physical_label[physical_index]
+            used_physical_qubit_mask |= 1 << physical_index
+
+            if handler is None:
+                # measure: record the mapping, no pulses are emitted
                 # TODO: intermediate measurement or partial measurement
-                virtual_index = qc.find_bit(instruction.clbits[0]).index
-                physical_index = qc.find_bit(instruction.qubits[0]).index
+                virtual_index = clbit_index[instruction.clbits[0]]
                 classical_bit_mapping[virtual_index] = physical_index
                 logger.debug(
-                    f"virtual qubit: {virtual_index} -> physical index: {physical_index} -> physical label: {self._backend.physical_label(physical_index)}"
+                    "virtual qubit: %s -> physical index: %s -> physical label: %s",
+                    virtual_index,
+                    physical_index,
+                    physical_label,
                 )
-            elif name == "delay":
-                duration = self.get_delay_in_ns(instruction.operation)
-                pulse_scheduler.append(self.delay(physical_label, duration))
-            elif name == "barrier":
-                pulse_scheduler.append(self.barrier())
-            else:
-                logger.error(f"Unsupported instruction: {name}")
-                pass
-        classical_registers = []
-        # qubex bit mapping is inversed of Qiskit e.g. qubex: | q0, q1, q2 >, qiskit: | q2, q1, q0 >
-        inversed_classical_bit_mapping = sorted(
-            classical_bit_mapping.items(), key=lambda x: x[0], reverse=True
+                continue
+
+            physical_target_label = None
+            if name == "cx":
+                physical_target_index = qubit_index[instruction.qubits[1]]
+                physical_target_label = physical_index_to_physical_label[
+                    physical_target_index
+                ]
+                used_physical_qubit_mask |= 1 << physical_target_index
+                used_physical_couplings.add((physical_label, physical_target_label))
+
+            operations.append(
+                (handler, instruction, physical_label, physical_target_label)
+            )
+
+        used_physical_qubits, used_physical_couplings = (
+            self._sorted_physical_qubits_and_couplings(
+                used_physical_qubit_mask, used_physical_couplings
+            )
         )
-        for virtual, physical in inversed_classical_bit_mapping:
-            classical_registers.append(self._backend.physical_label(physical))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("physical_map: %s", self._backend.physical_map)
+        # CR channels sharing each target, for the RZ correction
+        cr_channels_by_target: dict[str, list[str]] = {}
+        for coupling in used_physical_couplings:
+            cr_channels_by_target.setdefault(coupling.split("-")[1], []).append(
+                coupling
+            )
+
+        pulse_scheduler = _PulseScheduler()
+        for handler, instruction, physical_label, physical_target_label in operations:
+            handler(
+                pulse_scheduler,
+                instruction=instruction,
+                physical_label=physical_label,
+                physical_target_label=physical_target_label,
+                cr_channels_by_target=cr_channels_by_target,
+            )
+        # qubex bit mapping is inversed of Qiskit e.g. qubex: | q0, q1, q2 >, qiskit: | q2, q1, q0 >
+        classical_registers = [
+            physical_index_to_physical_label[classical_bit_mapping[virtual]]
+            for virtual in sorted(classical_bit_mapping, reverse=True)
+        ]
         self._backend.classical_registers = classical_registers
-        with PulseSchedule(
-            list(used_physical_qubits) + list(used_physical_couplings)
-        ) as circuit:
+        with PulseSchedule(used_physical_qubits + used_physical_couplings) as circuit:
             for ps in pulse_scheduler:
                 if ps == "barrier":
                     circuit.barrier()
@@ -1,19 +1,51 @@
 import logging
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
 
-from qiskit.qasm3 import loads
+import numpy as np
 from qulacs import QuantumCircuit as QulacsQuantumCircuit
 from qulacs import QuantumState
 
-from device_gateway.core.base_backend import SUCCESS_MESSAGE, BaseBackend
+from device_gateway.core.base_backend import (
+    SUCCESS_MESSAGE,
+    BaseBackend,
+    load_program,
+)
 from device_gateway.plugins.qulacs.circuit import QulacsCircuit
 
 logger = logging.getLogger("device_gateway")
 
+COMPILED_CIRCUIT_CACHE_SIZE = 128
+# Counts are remapped as packed uint64 keys up to this many bits
+MAX_PACKED_BITS = 64
+
+
+def _format_bitstrings(keys: np.ndarray, width: int) -> list[str]:
+    """Format integer keys as zero-padded binary strings, MSB first."""
+    if width == 0:
+        return [""] * len(keys)
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint64)
+    bits = ((keys[:, None] >> shifts) & 1).astype(np.uint8) + ord("0")
+    return bits.view(f"S{width}")[:, 0].astype(f"U{width}").tolist()
+
 
 class QulacsBackend(BaseBackend):
     def __init__(self, config: dict):
         super().__init__(config)
+        # program -> (compiled circuit, measure map, bit count) in LRU order
+        self._compiled_circuits: OrderedDict[
+            str, tuple[QulacsQuantumCircuit, dict[int, int], int]
+        ] = OrderedDict()
+        # execute() is called from several gRPC worker threads
+        self._compiled_circuits_lock = threading.Lock()
+        # bumped on every topology change; circuits compiled across one are dropped
+        self._compiled_circuits_generation = 0
+
+    def _clear_physical_map_cache(self):
+        super()._clear_physical_map_cache()
+        with self._compiled_circuits_lock:
+            self._compiled_circuits_generation += 1
+            self._compiled_circuits.clear()
 
     def _get_circuit(self) -> QulacsCircuit:
         return QulacsCircuit(self)
@@ -23,17 +55,63 @@ class QulacsBackend(BaseBackend):
         Execute the compiled circuit for a specified number of shots.
         The circuit is produced by the Circuit class.
         """
-        state = QuantumState(circuit.get_qubit_count())
+        n_qubits = circuit.get_qubit_count()
+        state = QuantumState(n_qubits)
         circuit.update_quantum_state(state)
-        result = Counter(state.sampling(shots))
-        counts = {}
-        for key, value in result.items():
-            counts[format(key, "0" + str(circuit.get_qubit_count()) + "b")] = value
-        return counts
+        samples = np.asarray(state.sampling(shots), dtype=np.uint64)
+        keys, values = np.unique(samples, return_counts=True)
+        return dict(zip(_format_bitstrings(keys, n_qubits), values.tolist()))
 
     def _remap_counts(
         self, full_counts: dict[str, int], measure_map: dict[int, int], bit_count: int
     ) -> dict[str, int]:
+        """
+        Remap the qubit counts onto the classical register.
+        Keys are packed into uint64 and moved with one masked shift per
+        distance; registers wider than MAX_PACKED_BITS fall back to strings.
+        """
+        if not full_counts:
+            return {}
+        key_width = len(next(iter(full_counts)))
+        if max(bit_count, key_width) > MAX_PACKED_BITS:
+            return self._remap_counts_by_string(full_counts, measure_map, bit_count)
+        # bit i of a key is qubit i, i.e. the i-th character from the right
+        keys = np.fromiter(
+            (int(bitstring, 2) for bitstring in full_counts),
+            dtype=np.uint64,
+            count=len(full_counts),
+        )
+        values = np.fromiter(
+            full_counts.values(), dtype=np.int64, count=len(full_counts)
+        )
+        # move each measured qubit's bit to its classical bit position, one
+        # masked shift per distinct distance; unassigned classical bits stay 0
+        destination_masks: dict[int, int] = {}
+        for clbit_index, qubit_index in measure_map.items():
+            shift = clbit_index - qubit_index
+            destination_masks[shift] = destination_masks.get(shift, 0) | (
+                1 << clbit_index
+            )
+        remapped = np.zeros_like(keys)
+        for shift, mask in destination_masks.items():
+            if shift >= 0:
+                moved = keys << np.uint64(shift)
+            else:
+                moved = keys >> np.uint64(-shift)
+            remapped |= moved & np.uint64(mask)
+        # different keys may collapse onto the same classical outcome
+        new_keys, inverse = np.unique(remapped, return_inverse=True)
+        new_values = np.zeros(len(new_keys), dtype=np.int64)
+        np.add.at(new_values, inverse, values)
+        return dict(zip(_format_bitstrings(new_keys, bit_count), new_values.tolist()))
+
+    def _remap_counts_by_string(
+        self, full_counts: dict[str, int], measure_map: dict[int, int], bit_count: int
+    ) -> dict[str, int]:
+        """
+        Remap the counts bit by bit on the strings.
+        Used for registers that do not fit in a packed uint64 key.
+        """
         result: Counter[str] = Counter()
 
         for bitstring, count in full_counts.items():
@@ -57,22 +135,42 @@ class QulacsBackend(BaseBackend):
 
         return dict(result)
 
-    def execute(self, program: str, shots: int = 1024) -> tuple[dict, str]:
-        qc = loads(program)
+    def _compile(
+        self, program: str
+    ) -> tuple[QulacsQuantumCircuit, dict[int, int], int]:
+        """
+        Compile the program and resolve its measurement mapping.
+        The result is cached per program text, so resubmissions skip compiling.
+        The parsed circuit is not needed afterwards, so it is not cached.
+        """
+        with self._compiled_circuits_lock:
+            cached = self._compiled_circuits.get(program)
+            if cached is not None:
+                self._compiled_circuits.move_to_end(program)
+                return cached
+            generation = self._compiled_circuits_generation
+
+        # Compile outside the lock; a concurrent miss only compiles twice
+        qc = load_program(program)
         circuit = self._get_circuit()
         compiled_circuit = circuit.compile(qc)
+        compiled = (compiled_circuit, circuit.measure_map, len(qc.clbits))
+        with self._compiled_circuits_lock:
+            if generation != self._compiled_circuits_generation:
+                # the topology changed while compiling, so do not cache it
+                return compiled
+            self._compiled_circuits[program] = compiled
+            self._compiled_circuits.move_to_end(program)
+            if len(self._compiled_circuits) > COMPILED_CIRCUIT_CACHE_SIZE:
+                self._compiled_circuits.popitem(last=False)
+        return compiled
+
+    def execute(self, program: str, shots: int = 1024) -> tuple[dict, str]:
+        self.refresh_device_topology()
+        compiled_circuit, measure_map, bit_count = self._compile(program)
         counts = self._execute(compiled_circuit, shots=shots)
         counts = self._remove_zero_values(counts)
-
-        measure_map = {}
-        for instruction in qc.data:
-            if instruction.name == "measure":
-                qubit_index = qc.find_bit(instruction.qubits[0])[0]
-                clbit_index = qc.find_bit(instruction.clbits[0])[0]
-                measure_map[clbit_index] = qubit_index
-
-        bit_count = len(qc.clbits)
         counts = self._remap_counts(counts, measure_map, bit_count)
-        logger.info(f"counts={counts}")
+        logger.info("counts=%s", counts)
 
         return counts, SUCCESS_MESSAGE
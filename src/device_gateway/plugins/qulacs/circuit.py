@@ -1,20 +1,91 @@
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-from qiskit import QuantumCircuit as QiskitQuantumCircuit
+import numpy as np
 from qulacs import QuantumCircuit as QulacsQuantumCircuit
 
 from device_gateway.core.base_circuit import BaseCircuit
 from device_gateway.core.gate_set import SUPPORTED_GATES
 
 if TYPE_CHECKING:
+    from qiskit import QuantumCircuit as QiskitQuantumCircuit
+
     from device_gateway.plugins.qulacs.backend import QulacsBackend
 
 logger = logging.getLogger("device_gateway")
 
+# Fuse single-qubit gates from this number of qubits on, as qiskit-aer does by default
+FUSION_THRESHOLD = 20
+
+_IDENTITY = np.eye(2, dtype=complex)
+_X = np.array([[0, 1], [1, 0]], dtype=complex)
+_SQRT_X = 0.5 * np.array([[1 + 1j, 1 - 1j], [1 - 1j, 1 + 1j]], dtype=complex)
+
+
+class _FusedQulacsCircuit:
+    """Qulacs circuit proxy that fuses consecutive single-qubit gates.
+
+    Single-qubit gates are accumulated per qubit as a 2x2 matrix and emitted as
+    one dense matrix gate when a CNOT touches the qubit or the circuit is
+    finalized, so the simulator traverses the state vector once per fused run.
+    Qubits whose fused gate is exactly X are emitted together as one multi-qubit
+    Pauli gate, and identities are dropped.
+    """
+
+    __slots__ = ("_circuit", "_pending")
+
+    def __init__(self, circuit: QulacsQuantumCircuit):
+        self._circuit = circuit
+        self._pending: dict[int, np.ndarray] = {}
+
+    def _apply(self, index: int, matrix: np.ndarray):
+        self._pending[index] = matrix @ self._pending.get(index, _IDENTITY)
+
+    def _emit(self, index: int, matrix: np.ndarray):
+        if not np.array_equal(matrix, _IDENTITY):
+            self._circuit.add_dense_matrix_gate(index, matrix)
+
+    def add_X_gate(self, index: int):
+        self._apply(index, _X)
+
+    def add_sqrtX_gate(self, index: int):
+        self._apply(index, _SQRT_X)
+
+    def add_RZ_gate(self, index: int, angle: float):
+        # Qulacs defines RZ(angle) as exp(i * angle / 2 * Z)
+        phase = np.exp(0.5j * angle)
+        self._apply(index, np.array([[phase, 0], [0, phase.conjugate()]]))
+
+    def add_CNOT_gate(self, control: int, target: int):
+        for index in (control, target):
+            matrix = self._pending.pop(index, None)
+            if matrix is not None:
+                self._emit(index, matrix)
+        self._circuit.add_CNOT_gate(control, target)
+
+    def finalize(self) -> QulacsQuantumCircuit:
+        """Emit the remaining fused gates and return the Qulacs circuit."""
+        x_indices = []
+        for index, matrix in sorted(self._pending.items()):
+            if np.array_equal(matrix, _X):
+                x_indices.append(index)
+            else:
+                self._emit(index, matrix)
+        if x_indices:
+            self._circuit.add_multi_Pauli_gate(x_indices, [1] * len(x_indices))
+        self._pending.clear()
+        return self._circuit
+
 
 class QulacsCircuit(BaseCircuit):
-    """Qulacs circuit implementation."""
+    """Qulacs circuit implementation.
+
+    RZ angles follow the Qiskit convention and are negated when added to the
+    Qulacs circuit, since Qulacs defines RZ(angle) as exp(i * angle / 2 * Z).
+    """
+
+    __slots__ = ("_backend", "_dispatch", "measure_map")
 
     def __init__(self, backend: "QulacsBackend"):
         """Initialize the circuit with backend.
@@ -23,15 +94,37 @@ class QulacsCircuit(BaseCircuit):
             backend: Backend to execute the circuit on
         """
         self._backend = backend
+        # classical bit index -> qubit index of the last compiled circuit
+        self.measure_map: dict[int, int] = {}
+        # gate name -> handler adding the gate in compile(); None means no-op
+        self._dispatch: dict[str, Callable[..., None] | None] = dict.fromkeys(
+            SUPPORTED_GATES
+        )
+        self._dispatch.update(
+            {
+                "x": self._compile_x,
+                "sx": self._compile_sx,
+                "rz": self._compile_rz,
+                "cx": self._compile_cx,
+            }
+        )
 
     def cx(self, circuit: QulacsQuantumCircuit, control: str, target: str):
         """Apply CX gate."""
-        if target not in self._backend.qubits or control not in self._backend.qubits:
+        if (
+            target not in self._backend.qubits_set
+            or control not in self._backend.qubits_set
+        ):
             logger.error(f"Invalid qubits for CNOT: {control}, {target}")
             raise ValueError(f"Invalid qubits for CNOT: {control}, {target}")
-        logger.debug(
-            f"Applying CX gate: {self._backend.physical_index(control)} -> {self._backend.physical_index(target)}, Physical qubits: {control} -> {target}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Applying CX gate: %s -> %s, Physical qubits: %s -> %s",
+                self._backend.physical_index(control),
+                self._backend.physical_index(target),
+                control,
+                target,
+            )
         circuit.add_CNOT_gate(
             self._backend.physical_label_to_physical_index[control],
             self._backend.physical_label_to_physical_index[target],
@@ -40,44 +133,65 @@ class QulacsCircuit(BaseCircuit):
 
     def sx(self, circuit: QulacsQuantumCircuit, target: str):
         """Apply SX gate."""
-        if target not in self._backend.qubits:
+        if target not in self._backend.qubits_set:
             logger.error(f"Invalid qubit: {target}")
             raise ValueError(f"Invalid qubit: {target}")
-        logger.debug(
-            f"Applying SX gate: {self._backend.physical_index(target)}, Physical qubit: {target}"
-        )
-        new_circuit = circuit.copy()
-        new_circuit.add_sqrtX_gate(
-            self._backend.physical_label_to_physical_index[target]
-        )
-        return new_circuit
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Applying SX gate: %s, Physical qubit: %s",
+                self._backend.physical_index(target),
+                target,
+            )
+        circuit.add_sqrtX_gate(self._backend.physical_label_to_physical_index[target])
+        return circuit
 
     def x(self, circuit: QulacsQuantumCircuit, target: str):
         """Apply X gate."""
-        if target not in self._backend.qubits:
+        if target not in self._backend.qubits_set:
             logger.error(f"Invalid qubit: {target}")
             raise ValueError(f"Invalid qubit: {target}")
-        logger.debug(
-            f"Applying X gate: {self._backend.physical_index(target)}, Physical qubit: {target}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Applying X gate: %s, Physical qubit: %s",
+                self._backend.physical_index(target),
+                target,
+            )
         circuit.add_X_gate(self._backend.physical_label_to_physical_index[target])
         return circuit
 
     def rz(self, circuit: QulacsQuantumCircuit, target: str, angle: float):
         """Apply RZ gate."""
-        if target not in self._backend.qubits:
+        if target not in self._backend.qubits_set:
             logger.error(f"Invalid qubit: {target}")
             raise ValueError(f"Invalid qubit: {target}")
-        logger.debug(
-            f"Applying RZ gate: {self._backend.physical_index(target)}, Physical qubit: {target}, angle={angle}"
-        )
-        new_circuit = circuit.copy()
-        new_circuit.add_RZ_gate(
-            self._backend.physical_label_to_physical_index[target], -1 * angle
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Applying RZ gate: %s, Physical qubit: %s, angle=%s",
+                self._backend.physical_index(target),
+                target,
+                angle,
+            )
+        circuit.add_RZ_gate(
+            self._backend.physical_label_to_physical_index[target], -angle
         )
-        return new_circuit
+        return circuit
+
+    # The _compile_* handlers are only called from compile(), whose indices come
+    # from the backend mapping, so they skip the validation done by x/sx/rz/cx.
+    def _compile_x(self, circuit, instruction, physical_indices):
+        circuit.add_X_gate(physical_indices[0])
+
+    def _compile_sx(self, circuit, instruction, physical_indices):
+        circuit.add_sqrtX_gate(physical_indices[0])
+
+    def _compile_rz(self, circuit, instruction, physical_indices):
+        # Qulacs' RZ(angle) is exp(i angle/2 Z), the inverse of Qiskit's RZ(angle)
+        circuit.add_RZ_gate(physical_indices[0], -instruction.params[0])
 
-    def compile(self, qc: QiskitQuantumCircuit) -> QulacsQuantumCircuit:
+    def _compile_cx(self, circuit, instruction, physical_indices):
+        circuit.add_CNOT_gate(physical_indices[0], physical_indices[1])
+
+    def compile(self, qc: "QiskitQuantumCircuit") -> QulacsQuantumCircuit:
         """Compile a Qiskit circuit to a Qulacs circuit.
 
         Args:
@@ -90,30 +204,48 @@ class QulacsCircuit(BaseCircuit):
             ValueError: If an unsupported instruction is encountered
         """
         circuit = QulacsQuantumCircuit(qc.num_qubits)
+        # Large circuits are simulated with fused single-qubit gates
+        fused_circuit = None
+        if qc.num_qubits >= FUSION_THRESHOLD:
+            fused_circuit = _FusedQulacsCircuit(circuit)
+        builder = circuit if fused_circuit is None else fused_circuit
+        # Resolve each Qiskit qubit to its physical index once instead of
+        # going through the physical label for every instruction
+        physical_index_to_physical_label = (
+            self._backend.physical_index_to_physical_label
+        )
+        label_to_index = self._backend.physical_label_to_physical_index
+        qubit_to_physical_index = {
+            qubit: label_to_index[physical_index_to_physical_label[index]]
+            for index, qubit in enumerate(qc.qubits)
+            if index in physical_index_to_physical_label
+        }
+        qubit_index = {qubit: index for index, qubit in enumerate(qc.qubits)}
+        clbit_index = {clbit: index for index, clbit in enumerate(qc.clbits)}
+        measure_map = {}
 
         for instruction in qc.data:
             name = instruction.name
-            if name not in SUPPORTED_GATES:
+            try:
+                handler = self._dispatch[name]
+            except KeyError:
                 logger.error(f"Unsupported instruction: {name}")
-                raise ValueError(f"Unsupported instruction: {name}")
-
-            physical_index = qc.find_bit(instruction.qubits[0]).index
-            physical_label = self._backend.physical_label(physical_index)
-
-            if name == "x":
-                circuit = self.x(circuit, physical_label)
-            elif name == "sx":
-                circuit = self.sx(circuit, physical_label)
-            elif name == "rz":
-                angle = instruction.params[0]
-                circuit = self.rz(circuit, physical_label, angle)
-            elif name == "cx":
-                physical_target_index = qc.find_bit(instruction.qubits[1]).index
-                physical_target_label = self._backend.physical_label(
-                    physical_target_index
-                )
-                circuit = self.cx(circuit, physical_label, physical_target_label)
-            else:
-                pass
-
+                raise ValueError(f"Unsupported instruction: {name}") from None
+            if handler is None:
+                # supported, but nothing to simulate (e.g., measure, barrier);
+                # measurements are resolved from the mapping after sampling
+                if name == "measure":
+                    measure_map[clbit_index[instruction.clbits[0]]] = qubit_index[
+                        instruction.qubits[0]
+                    ]
+                continue
+
+            physical_indices = [
+                qubit_to_physical_index[qubit] for qubit in instruction.qubits
+            ]
+            handler(builder, instruction, physical_indices)
+
+        if fused_circuit is not None:
+            fused_circuit.finalize()
+        self.measure_map = measure_map
         return circuit
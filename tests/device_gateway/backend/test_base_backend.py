@@ -0,0 +1,219 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from device_gateway.core.base_backend import BaseBackend
+
+device_topology = """{
+  "name": "anemone",
+  "device_id": "anemone",
+  "qubits": [
+    {
+      "id": 0,
+      "physical_id": 0
+    },
+    {
+      "id": 1,
+      "physical_id": 1
+    }
+  ],
+  "couplings": [
+    {
+      "control": 0,
+      "target": 1
+    }
+  ],
+  "calibrated_at": "2025-04-20T10:03:16.755183Z"
+}
+"""
+
+
+class DummyCircuit:
+    def compile(self, qc):
+        return qc
+
+
+class DummyBackend(BaseBackend):
+    def _get_circuit(self) -> DummyCircuit:
+        return DummyCircuit()
+
+    def _execute(self, circuit, shots: int = 1024) -> dict:
+        return {"0" * circuit.num_clbits: shots}
+
+
+class InterleavingBackend(DummyBackend):
+    """Runs a callback the first time the topology is read."""
+
+    interleave = None
+
+    @property
+    def device_topology(self) -> dict:
+        device_topology = super().device_topology
+        if self.interleave is not None:
+            interleave, self.interleave = self.interleave, None
+            interleave()
+        return device_topology
+
+
+class TestBaseBackend:
+    def test_device_topology__loaded_once(self, mocker) -> None:
+        # Arrange
+        load_device_topology = mocker.patch(
+            "device_gateway.core.base_backend.BaseBackend.load_device_topology",
+            return_value=json.loads(device_topology),
+        )
+        backend = DummyBackend({})
+        program = """
+            OPENQASM 3;
+            include "stdgates.inc";
+            bit[2] c;
+            x $0;
+            cx $0, $1;
+            c[0] = measure $0;
+            c[1] = measure $1;
+        """
+
+        # Act
+        backend.execute(program, shots=100)
+        backend.execute(program, shots=100)
+
+        # Assert
+        load_device_topology.assert_called_once()
+
+    def test_device_info(self, mocker) -> None:
+        # Arrange
+        mocker.patch(
+            "device_gateway.core.base_backend.BaseBackend.load_device_topology",
+            return_value=json.loads(device_topology),
+        )
+        config = {"device_info": {"device_id": "qulacs"}}
+        backend = DummyBackend(config)
+
+        # Act
+        device_info = backend.device_info
+
+        # Assert
+        assert device_info == {"device_id": "qulacs", "type": "simulator"}
+        assert config["device_info"] == {"device_id": "qulacs"}
+
+    def test_device_status(self, mocker, tmp_path) -> None:
+        # Arrange
+        mocker.patch(
+            "device_gateway.core.base_backend.BaseBackend.load_device_topology",
+            return_value=json.loads(device_topology),
+        )
+        device_status_path = tmp_path / "device_status"
+        device_status_path.write_text("active\n")
+        backend = DummyBackend({"device_status_path": str(device_status_path)})
+        load_device_status = mocker.spy(backend, "load_device_status")
+
+        # Act & Assert
+        assert backend.is_active()
+        assert backend.is_active()
+        assert load_device_status.call_count == 1
+
+        device_status_path.write_text("inactive\n")
+        assert backend.is_inactive()
+        assert load_device_status.call_count == 2
+
+    def test_device_topology__reloaded_when_file_changes(self, tmp_path) -> None:
+        # Arrange
+        device_topology_path = tmp_path / "device_topology.json"
+        device_topology_path.write_text(device_topology)
+        backend = DummyBackend({"device_topology_json_path": str(device_topology_path)})
+        assert backend.qubits == ("Q00", "Q01")
+        assert backend.device_topology["calibrated_at"] == (
+            "2025-04-20T10:03:16.755183Z"
+        )
+
+        # Act
+        new_device_topology = json.loads(device_topology)
+        new_device_topology["qubits"][1]["physical_id"] = 2
+        new_device_topology["calibrated_at"] = "2025-04-21T10:03:16.755183Z"
+        device_topology_path.write_text(json.dumps(new_device_topology, indent=4))
+
+        # Assert
+        assert backend.device_topology["calibrated_at"] == (
+            "2025-04-21T10:03:16.755183Z"
+        )
+        assert backend.qubits == ("Q00", "Q02")
+
+    def test_device_topology__not_reloaded_when_file_unchanged(
+        self, mocker, tmp_path
+    ) -> None:
+        # Arrange
+        device_topology_path = tmp_path / "device_topology.json"
+        device_topology_path.write_text(device_topology)
+        backend = DummyBackend({"device_topology_json_path": str(device_topology_path)})
+        load_device_topology = mocker.spy(backend, "load_device_topology")
+
+        # Act
+        first = backend.device_topology
+        second = backend.device_topology
+
+        # Assert
+        assert first is second
+        load_device_topology.assert_not_called()
+
+    def test_save_device_topology(self, mocker, tmp_path) -> None:
+        # Arrange
+        device_topology_path = tmp_path / "device_topology.json"
+        device_topology_path.write_text(device_topology)
+        backend = DummyBackend({"device_topology_json_path": str(device_topology_path)})
+        load_device_topology = mocker.spy(backend, "load_device_topology")
+        new_device_topology = json.loads(device_topology)
+        new_device_topology["qubits"][1]["physical_id"] = 2
+
+        # Act
+        backend.save_device_topology(new_device_topology)
+
+        # Assert
+        assert json.loads(device_topology_path.read_text()) == new_device_topology
+        assert backend.qubits == ("Q00", "Q02")
+        load_device_topology.assert_not_called()
+
+    def test_physical_map__topology_changed_during_computation(self, tmp_path) -> None:
+        # Arrange
+        device_topology_path = tmp_path / "device_topology.json"
+        device_topology_path.write_text(device_topology)
+        backend = InterleavingBackend(
+            {"device_topology_json_path": str(device_topology_path)}
+        )
+        new_device_topology = json.loads(device_topology)
+        new_device_topology["qubits"][1]["physical_id"] = 12
+
+        def change_topology() -> None:
+            # another worker reloads the topology while physical_map is computed
+            device_topology_path.write_text(json.dumps(new_device_topology, indent=4))
+            backend.refresh_device_topology()
+
+        backend.interleave = change_topology
+
+        # Act
+        stale_physical_map = backend.physical_map
+
+        # Assert
+        assert stale_physical_map["qubits"] == {0: "Q00", 1: "Q01"}
+        assert backend.physical_map["qubits"] == {0: "Q00", 1: "Q12"}
+        assert backend.qubits == ("Q00", "Q12")
+        assert backend.physical_label_to_physical_index == {"Q00": 0, "Q12": 1}
+
+    def test_refresh_device_topology__concurrent_reload(self, mocker, tmp_path) -> None:
+        # Arrange
+        device_topology_path = tmp_path / "device_topology.json"
+        device_topology_path.write_text(device_topology)
+        backend = DummyBackend({"device_topology_json_path": str(device_topology_path)})
+        load_device_topology = mocker.spy(backend, "load_device_topology")
+        new_device_topology = json.loads(device_topology)
+        new_device_topology["qubits"][1]["physical_id"] = 12
+        device_topology_path.write_text(json.dumps(new_device_topology, indent=4))
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda _: backend.refresh_device_topology(), range(32))
+            )
+
+        # Assert
+        assert load_device_topology.call_count == 1
+        assert all(result is results[0] for result in results)
+        assert backend.qubits == ("Q00", "Q12")
@@ -0,0 +1,120 @@
+import logging
+import sys
+import types
+
+import pytest
+
+from device_gateway.core.base_backend import BaseBackend
+from device_gateway.core.plugin_manager import BackendPluginManager
+
+
+class DummyBackend(BaseBackend):
+    def _get_circuit(self):
+        return None
+
+    def _execute(self, circuit, shots: int = 1024) -> dict:
+        return {}
+
+
+class OtherDummyBackend(DummyBackend):
+    pass
+
+
+def plugin_config(module_path: str, class_name: str) -> dict:
+    return {
+        "plugin": {
+            "name": "dummy",
+            "backend": {"module_path": module_path, "class_name": class_name},
+        }
+    }
+
+
+class TestBackendPluginManager:
+    def test_load_backend(self) -> None:
+        # Arrange
+        manager = BackendPluginManager()
+
+        # Act
+        manager.load_backend(plugin_config(__name__, "DummyBackend"))
+
+        # Assert
+        assert manager._backends["dummy"] is DummyBackend
+
+    def test_load_backend__same_config_is_noop(self, mocker, caplog) -> None:
+        # Arrange
+        manager = BackendPluginManager()
+        config = plugin_config(__name__, "DummyBackend")
+        manager.load_backend(config)
+        register_backend = mocker.spy(BackendPluginManager, "register_backend")
+
+        # Act
+        with caplog.at_level(logging.INFO, logger="device_gateway"):
+            manager.load_backend(config)
+
+        # Assert
+        register_backend.assert_not_called()
+        assert "Registered backend plugin" not in caplog.text
+        assert manager._backends["dummy"] is DummyBackend
+
+    def test_load_backend__switching_class_name_reregisters(self, caplog) -> None:
+        # Arrange
+        manager = BackendPluginManager()
+        manager.load_backend(plugin_config(__name__, "DummyBackend"))
+
+        # Act
+        with caplog.at_level(logging.INFO, logger="device_gateway"):
+            manager.load_backend(plugin_config(__name__, "OtherDummyBackend"))
+
+        # Assert
+        assert manager._backends["dummy"] is OtherDummyBackend
+        assert "Registered backend plugin: dummy" in caplog.text
+
+    def test_load_backend__missing_module(self, caplog) -> None:
+        # Arrange
+        manager = BackendPluginManager()
+        module_path = "device_gateway.plugins.missing.backend"
+
+        # Act & Assert
+        with pytest.raises(ImportError):
+            manager.load_backend(plugin_config(module_path, "MissingBackend"))
+        assert f"Failed to import backend module {module_path}" in caplog.text
+        assert "dummy" not in manager._backends
+
+    def test_load_backend__missing_class(self, caplog) -> None:
+        # Arrange
+        manager = BackendPluginManager()
+
+        # Act & Assert
+        with pytest.raises(AttributeError):
+            manager.load_backend(plugin_config(__name__, "MissingBackend"))
+        assert f"Failed to find backend class MissingBackend in module {__name__}" in (
+            caplog.text
+        )
+        assert "dummy" not in manager._backends
+
+    def test_load_backend__failed_import_is_not_cached(self, monkeypatch) -> None:
+        # Arrange
+        manager = BackendPluginManager()
+        module_path = "dummy_backend_plugin_not_cached"
+        config = plugin_config(module_path, "DummyBackend")
+        with pytest.raises(ImportError):
+            manager.load_backend(config)
+        module = types.ModuleType(module_path)
+        monkeypatch.setitem(sys.modules, module_path, module)
+        with pytest.raises(AttributeError):
+            manager.load_backend(config)
+
+        # Act
+        module.DummyBackend = DummyBackend  # type: ignore[attr-defined]
+        manager.load_backend(config)
+
+        # Assert
+        assert manager._backends["dummy"] is DummyBackend
+
+    def test_register_backend__invalid_class(self) -> None:
+        # Arrange
+        manager = BackendPluginManager()
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            manager.register_backend("dummy", object)  # type: ignore[arg-type]
@@ -0,0 +1,199 @@
+import importlib
+import sys
+import types
+from dataclasses import dataclass
+
+import pytest
+from qiskit import QuantumCircuit
+
+CIRCUIT_MODULE = "device_gateway.plugins.qubex.circuit"
+
+
+class PulseSchedule:
+    """Records the operations added to a qubex pulse schedule."""
+
+    def __init__(self, targets=None):
+        self.targets = list(targets or [])
+        self.ops = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def add(self, target, waveform):
+        self.ops.append(("add", target, waveform))
+
+    def call(self, schedule):
+        self.ops.append(("call", schedule))
+
+    def barrier(self):
+        self.ops.append(("barrier",))
+
+
+@dataclass
+class Blank:
+    duration: float
+
+
+@dataclass
+class VirtualZ:
+    angle: float
+
+
+class Experiment:
+    def x90(self, target):
+        return f"x90[{target}]"
+
+    def x180(self, target):
+        return f"x180[{target}]"
+
+    def cx(self, control, target):
+        ps = PulseSchedule([control, target])
+        ps.add(control, f"cx[{control},{target}]")
+        return ps
+
+
+def flatten(schedule: PulseSchedule) -> list:
+    """Returns the operations of the schedule with called schedules expanded."""
+    return [("call", flatten(op[1])) if op[0] == "call" else op for op in schedule.ops]
+
+
+@pytest.fixture
+def circuit(monkeypatch):
+    qubex = types.ModuleType("qubex")
+    pulse = types.ModuleType("qubex.pulse")
+    pulse.PulseSchedule = PulseSchedule  # type: ignore[attr-defined]
+    pulse.Blank = Blank  # type: ignore[attr-defined]
+    pulse.VirtualZ = VirtualZ  # type: ignore[attr-defined]
+    qubex.pulse = pulse  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "qubex", qubex)
+    monkeypatch.setitem(sys.modules, "qubex.pulse", pulse)
+    previous_module = sys.modules.pop(CIRCUIT_MODULE, None)
+    try:
+        module = importlib.import_module(CIRCUIT_MODULE)
+        labels = {index: f"Q{index:02}" for index in range(4)}
+        backend = types.SimpleNamespace(
+            _experiment=Experiment(),
+            qubits_set=frozenset(labels.values()),
+            couplings=("Q00-Q01", "Q02-Q01"),
+            physical_index_to_physical_label=labels,
+            physical_label=labels.__getitem__,
+        )
+        yield module.QubexCircuit(backend)
+    finally:
+        sys.modules.pop(CIRCUIT_MODULE, None)
+        if previous_module is not None:
+            sys.modules[CIRCUIT_MODULE] = previous_module
+
+
+def run(target: str, *waveforms: str) -> tuple:
+    return ("call", [("add", target, waveform) for waveform in waveforms])
+
+
+def cx(control: str, target: str) -> tuple:
+    return ("call", [("call", [("add", control, f"cx[{control},{target}]")])])
+
+
+def virtual_z(target: str, angle: float) -> tuple:
+    return ("call", [("add", target, VirtualZ(angle))])
+
+
+class TestQubexCircuit:
+    def test_compile__run_broken_by_cx(self, circuit) -> None:
+        # Arrange
+        qc = QuantumCircuit(3)
+        qc.sx(0)
+        qc.sx(2)
+        qc.cx(0, 1)
+        qc.x(0)
+        qc.x(2)
+
+        # Act
+        schedule = circuit.compile(qc)
+
+        # Assert
+        assert schedule.targets == ["Q00", "Q01", "Q02", "Q00-Q01"]
+        # the run on Q02 is not touched by the CX and is emitted where it started
+        assert flatten(schedule) == [
+            run("Q00", "x90[Q00]"),
+            run("Q02", "x90[Q02]", "x180[Q02]"),
+            cx("Q00", "Q01"),
+            run("Q00", "x180[Q00]"),
+        ]
+
+    def test_compile__run_broken_by_delay(self, circuit) -> None:
+        # Arrange
+        qc = QuantumCircuit(2)
+        qc.x(0)
+        qc.sx(1)
+        qc.delay(100, 0, unit="ns")
+        qc.x(0)
+        qc.sx(1)
+
+        # Act
+        schedule = circuit.compile(qc)
+
+        # Assert
+        assert flatten(schedule) == [
+            run("Q00", "x180[Q00]"),
+            run("Q01", "x90[Q01]", "x90[Q01]"),
+            ("call", [("add", "Q00", Blank(100.0))]),
+            run("Q00", "x180[Q00]"),
+        ]
+
+    def test_compile__runs_cleared_by_rz_barrier(self, circuit) -> None:
+        # Arrange
+        qc = QuantumCircuit(2)
+        qc.sx(0)
+        qc.sx(1)
+        qc.rz(0.5, 1)
+        qc.sx(0)
+        qc.sx(1)
+
+        # Act
+        schedule = circuit.compile(qc)
+
+        # Assert
+        # the barrier locking the virtual Z closes the run on every qubit
+        assert flatten(schedule) == [
+            run("Q00", "x90[Q00]"),
+            run("Q01", "x90[Q01]"),
+            ("barrier",),
+            virtual_z("Q01", 0.5),
+            run("Q00", "x90[Q00]"),
+            run("Q01", "x90[Q01]"),
+        ]
+
+    def test_compile__rz_correction_on_cr_channels(self, circuit) -> None:
+        # Arrange
+        qc = QuantumCircuit(3)
+        qc.cx(0, 1)
+        qc.cx(2, 1)
+        qc.rz(0.25, 1)
+        qc.x(1)
+
+        # Act
+        schedule = circuit.compile(qc)
+
+        # Assert
+        assert flatten(schedule) == [
+            cx("Q00", "Q01"),
+            cx("Q02", "Q01"),
+            ("barrier",),
+            virtual_z("Q01", 0.25),
+            virtual_z("Q00-Q01", 0.25),
+            virtual_z("Q02-Q01", 0.25),
+            ("barrier",),
+            run("Q01", "x180[Q01]"),
+        ]
+
+    def test_compile__unsupported_instruction(self, circuit) -> None:
+        # Arrange
+        qc = QuantumCircuit(1)
+        qc.h(0)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unsupported instruction: h"):
+            circuit.compile(qc)
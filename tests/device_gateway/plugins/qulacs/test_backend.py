@@ -1,5 +1,8 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 
+from device_gateway.core.base_backend import parse_program
+from device_gateway.plugins.qulacs import backend as qulacs_backend
 from device_gateway.plugins.qulacs.backend import QulacsBackend
 
 device_topology = """{
@@ -204,3 +207,176 @@ class TestQulacsBackend:
         assert isinstance(counts, dict)
         assert "0" in counts
         assert message == "job is succeeded"
+
+    def test_execute__fused_single_qubit_gates(self, mocker) -> None:
+        # Arrange
+        mocker.patch(
+            "device_gateway.core.base_backend.BaseBackend.load_device_topology",
+            return_value=json.loads(device_topology),
+        )
+        mocker.patch("device_gateway.plugins.qulacs.circuit.FUSION_THRESHOLD", 0)
+        backend = QulacsBackend({})
+        # sx-sx on $2 is an X gate, x-x on $3 cancels out
+        program = """
+            OPENQASM 3;
+            include "stdgates.inc";
+            bit[4] c;
+            x $0;
+            rz(0.5) $1;
+            sx $2;
+            sx $2;
+            x $3;
+            x $3;
+            cx $0, $1;
+            c[0] = measure $0;
+            c[1] = measure $1;
+            c[2] = measure $2;
+            c[3] = measure $3;
+        """
+
+        # Act
+        counts, message = backend.execute(program, shots=1000)
+
+        # Assert
+        assert counts == {"0111": 1000}
+        assert message == "job is succeeded"
+
+    def test_execute__program_compiled_once(self, mocker) -> None:
+        # Arrange
+        mocker.patch(
+            "device_gateway.core.base_backend.BaseBackend.load_device_topology",
+            return_value=json.loads(device_topology),
+        )
+        backend = QulacsBackend({})
+        get_circuit = mocker.spy(backend, "_get_circuit")
+        load_program = mocker.spy(qulacs_backend, "load_program")
+        program = """
+            OPENQASM 3;
+            include "stdgates.inc";
+            bit[1] c;
+            x $0;
+            c[0] = measure $0;
+        """
+        parse_program.cache_clear()
+
+        # Act
+        first_counts, _ = backend.execute(program, shots=100)
+        second_counts, _ = backend.execute(program, shots=100)
+
+        # Assert
+        assert first_counts == second_counts == {"1": 100}
+        assert load_program.call_count == 1
+        assert get_circuit.call_count == 1
+        # the compiled circuit is cached, so the parsed circuit is not kept
+        assert parse_program.cache_info().currsize == 0
+
+    def test_execute__concurrent_eviction(self, mocker) -> None:
+        # Arrange
+        mocker.patch(
+            "device_gateway.core.base_backend.BaseBackend.load_device_topology",
+            return_value=json.loads(device_topology),
+        )
+        mocker.patch(
+            "device_gateway.plugins.qulacs.backend.COMPILED_CIRCUIT_CACHE_SIZE", 1
+        )
+        backend = QulacsBackend({})
+        programs = [
+            f"""
+            OPENQASM 3;
+            include "stdgates.inc";
+            bit[1] c;
+            {gate} $0;
+            c[0] = measure $0;
+            """
+            for gate in ("x", "sx")
+        ]
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda i: backend.execute(programs[i % 2], shots=10), range(200)
+                )
+            )
+
+        # Assert
+        assert all(message == "job is succeeded" for _, message in results)
+        assert len(backend._compiled_circuits) == 1
+
+        # Arrange: the topology changes while a program is being compiled
+        backend._clear_physical_map_cache()
+        get_circuit = backend._get_circuit
+
+        def get_circuit_and_clear():
+            backend._clear_physical_map_cache()
+            return get_circuit()
+
+        mocker.patch.object(backend, "_get_circuit", side_effect=get_circuit_and_clear)
+
+        # Act
+        counts, message = backend.execute(programs[0], shots=10)
+
+        # Assert: the circuit compiled across the change is not cached
+        assert counts == {"1": 10}
+        assert message == "job is succeeded"
+        assert programs[0] not in backend._compiled_circuits
+
+    def test_remap_counts(self, mocker) -> None:
+        # Arrange
+        mocker.patch(
+            "device_gateway.core.base_backend.BaseBackend.load_device_topology",
+            return_value=json.loads(device_topology),
+        )
+        backend = QulacsBackend({})
+        full_counts = {"0001": 3, "0011": 5, "0110": 7}
+        # c[0] <- $1, c[2] <- $0, c[1] is not assigned; $2 and $3 are dropped
+        measure_map = {0: 1, 2: 0}
+
+        # Act
+        counts = backend._remap_counts(full_counts, measure_map, 3)
+
+        # Assert
+        assert counts == {"100": 3, "101": 5, "001": 7}
+
+    def test_remap_counts__wide_register(self, mocker) -> None:
+        # Arrange
+        mocker.patch(
+            "device_gateway.core.base_backend.BaseBackend.load_device_topology",
+            return_value=json.loads(device_topology),
+        )
+        backend = QulacsBackend({})
+        full_counts = {"0001": 3, "0011": 5, "0110": 7}
+        # classical bits beyond 64 do not fit in a packed key
+        measure_map = {69: 0, 64: 1, 3: 2}
+
+        # Act
+        counts = backend._remap_counts(full_counts, measure_map, 70)
+
+        # Assert
+        assert counts == {
+            "1" + "0" * 69: 3,
+            "10000" + "1" + "0" * 64: 5,
+            "00000" + "1" + "0" * 60 + "1000": 7,
+        }
+
+    def test_execute__wide_register(self, mocker) -> None:
+        # Arrange
+        mocker.patch(
+            "device_gateway.core.base_backend.BaseBackend.load_device_topology",
+            return_value=json.loads(device_topology),
+        )
+        backend = QulacsBackend({})
+        program = """
+            OPENQASM 3;
+            include "stdgates.inc";
+            bit[70] c;
+            x $0;
+            c[69] = measure $0;
+        """
+
+        # Act
+        counts, message = backend.execute(program, shots=10)
+
+        # Assert
+        assert counts == {"1" + "0" * 69: 10}
+        assert message == "job is succeeded"